@@ -1,35 +1,60 @@
 # Author: Hansheng Zhao <zhaohans@msu.edu> (https://www.zhs.me)
 
 
+def _stringify(key):
+  """
+  Convert key into string bytes
+  :param key: mixed, numeric or collection
+  :return: bytes, bytes representation of key
+  """
+  return str(key).encode(encoding = 'UTF8')
+
+
+# key converters for exact types
+_CONVERTERS = {
+  str: str.encode, bytearray: bytes,
+  int: _stringify, float: _stringify, complex: _stringify,
+  range: _stringify, tuple: _stringify, frozenset: _stringify
+}
+
+
 class BaseStructure(object):
   """ Redis interfaces base structure """
 
   __slots__ = (
-    '_type', '_redis', '_token', '_serialize'
+    '_type', '_redis', '_token',
+    '_serialize', '_dumps', '_loads',
+    '_scripts', '_missing'
   )
 
   TOKEN_LENGTH = 16
 
-  def __init__(self, redis, token = None):
+  def __init__(self, redis, token = None, serialize = None):
     """
     BaseStructure class constructor
-    :param redis: redis, the redis instance
+    :param redis: redis|None, the redis instance
     :param token: mixed, the access token
+    :param serialize: mixed, the serializer
     """
-    # import urandom and SeCo
+    # import urandom, client and Serialize
     from os import urandom
-    from seco import SeCo
+    from .Pool import default_client
+    from .Serialize import Serialize
     # set the default type
     self._type = b'none'
-    # preserve redis instance
-    self._redis = redis
+    # preserve redis instance or the default one
+    self._redis = default_client() \
+      if redis is None else redis
     # assign remote access token
     self._token = urandom(self.TOKEN_LENGTH) \
       if token is None else self._convert(token)
-    # set default serializer
-    self._serialize = SeCo(
-      serialize = 'msgpack', compress = 'zlib'
-    )
+    # registered lua scripts
+    self._scripts = {}
+    # commands missing on the redis server
+    self._missing = set()
+    # set serializer or the default one
+    self.serialize = Serialize.default() \
+      if serialize is None else serialize
 
   @property
   def token(self):
@@ -63,6 +88,9 @@ class BaseStructure(object):
     :return: None
     """
     self._serialize = serialize
+    # bind serializer methods directly
+    self._dumps = serialize.dumps
+    self._loads = serialize.loads
 
   @staticmethod
   def _convert(key):
@@ -71,6 +99,21 @@ class BaseStructure(object):
     :param key: mixed, any hashable object
     :return: bytes, bytes representation of key
     """
+    # bytes keys need no conversion
+    if type(key) is bytes:
+      return key
+    # dispatch on the exact key type
+    converter = _CONVERTERS.get(type(key))
+    return BaseStructure._convert_slow(key) \
+      if converter is None else converter(key)
+
+  @staticmethod
+  def _convert_slow(key):
+    """
+    Convert key of subclassed types
+    :param key: mixed, any hashable object
+    :return: bytes, bytes representation of key
+    """
     # check if key is supported or hashable
     # support bytes by default
     if isinstance(key, bytes):
@@ -101,21 +144,45 @@ class BaseStructure(object):
       # remove token of different types
       self._redis.delete(self._token)
 
-  def _dumps(self, payload):
+  def _script(self, script):
     """
-    Serialize value using serializer
-    :param payload: mixed, value
-    :return: bytes, the result
+    Acquire a registered lua script
+    :param script: str, the lua source
+    :return: Script, the callable script
     """
-    return self._serialize.dumps(payload)
+    scripts = self._scripts
+    # register script on first use
+    if script not in scripts:
+      scripts[script] = self._redis.register_script(script)
+    return scripts[script]
 
-  def _loads(self, payload):
+  def _command(self, name, command, fallback):
     """
-    Un-serialize value using serializer
-    :param payload: bytes|string, payload
-    :return: mixed, the object
-    """
-    return self._serialize.loads(payload)
+    Run a newer command or its fallback
+
+    Unknown commands and options, ie: HSCAN
+    NOVALUES before redis 7.4, are recorded
+    and use the fallback from then on
+
+    :param name: str, the newer command name
+    :param command: callable, the newer command
+    :param fallback: callable, for older servers
+    :return: mixed, the result
+    """
+    # import redis response error
+    from redis.exceptions import ResponseError
+    missing = self._missing
+    # skip commands known to be missing
+    if name not in missing:
+      try:
+        return command()
+      except ResponseError as error:
+        # re-raise errors other than missing command
+        message = str(error).lower()
+        if 'unknown command' not in message \
+          and 'syntax error' not in message: raise
+        missing.add(name)
+    return fallback()
 
   def delete(self):
     """
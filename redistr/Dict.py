@@ -16,16 +16,30 @@ class Dict(BaseStructure):
 
   __slots__ = ()
 
-  def __init__(self, redis, token = None):
+  # fields per HMGET command
+  CHUNK_SIZE = 100
+  # fields per HSCAN iteration
+  SCAN_COUNT = 500
+
+  # acquire and remove a field
+  SCRIPT_POP = """
+    local value = redis.call('HGET', KEYS[1], ARGV[1])
+    redis.call('HDEL', KEYS[1], ARGV[1])
+    return value
+  """
+
+  def __init__(self, redis, token = None, serialize = None):
     """
     Dict interface constructor
     :param redis: redis, the instance
     :param token: mixed, the token
+    :param serialize: mixed, the serializer
     """
-    super(Dict, self).__init__(redis, token)
+    super(Dict, self).__init__(redis, token, serialize)
     # set the default data type
     self._type = b'hash'
-    self._initiate()
+    # random tokens cannot pre-exist
+    if token is not None: self._initiate()
 
   def __contains__(self, key):
     """
@@ -66,14 +80,36 @@ class Dict(BaseStructure):
     :param other: dict|Dict, dict-like
     :return: bool, equal or not
     """
-    if len(self) == len(other):
-      return dict(self) == (
-        dict(other)
-        if isinstance(other, Dict)
-        else other
-      )
+    # acquire raw content in one round-trip
+    content = self._redis.hgetall(self._token)
+    # acquire other's content with keys converted
+    if isinstance(other, Dict):
+      loads = other._loads
+      other = {
+        key: loads(value) for key, value
+        in other._redis.hgetall(other._token).items()
+      }
+    elif hasattr(other, 'items'):
+      convert = self._convert
+      try:
+        other = {
+          convert(key): value
+          for key, value in other.items()
+        }
+      except TypeError:
+        # unsupported keys cannot be stored
+        return False
     else:
       return False
+    # compare lengths before values
+    if len(content) != len(other):
+      return False
+    # compare values, stop on first mismatch
+    loads = self._loads
+    for key, value in content.items():
+      if key not in other or loads(value) != other[key]:
+        return False
+    return True
 
   def __getattr__(self, key):
     """
@@ -101,9 +137,36 @@ class Dict(BaseStructure):
   def __iter__(self):
     """
     Iterator to get keys in store
+
+    Streams keys with HSCAN NOVALUES, falls
+    back to HSCAN before redis 7.4; repeated
+    keys are skipped, keys changed while
+    iterating may or may not appear
+
     :return: generator, the iterator
     """
-    yield from self._redis.hkeys(self._token)
+    # acquire resources
+    redis = self._redis
+    token = self._token
+    count = self.SCAN_COUNT
+    # scan keys only where supported
+    cursor, keys = self._command(
+      'HSCAN NOVALUES',
+      lambda: redis.hscan(token, 0, count = count, no_values = True),
+      lambda: redis.hscan(token, 0, count = count)
+    )
+    # redis-py sends NOVALUES unless it is None
+    no_values = None if 'HSCAN NOVALUES' in self._missing else True
+    # raw keys already yielded
+    seen = set()
+    while True:
+      keys = set(keys).difference(seen)
+      seen.update(keys)
+      yield from keys
+      if cursor == 0: break
+      cursor, keys = redis.hscan(
+        token, cursor, count = count, no_values = no_values
+      )
 
   def __len__(self):
     """
@@ -161,9 +224,8 @@ class Dict(BaseStructure):
     Return a new instance
     :return: instance
     """
-    instance = Dict(self._redis, self._token)
-    instance.serialize = self._serialize
-    return instance
+    # bind the serializer once at construction
+    return Dict(self._redis, self._token, self._serialize)
 
   @staticmethod
   def fromkeys(*args, **kwargs):
@@ -185,14 +247,38 @@ class Dict(BaseStructure):
     return self.__getitem__(key) \
       if key in self else default
 
+  def get_many(self, keys, default = None):
+    """
+    Acquire multiple items from store
+    :param keys: iterable, the keys
+    :param default: mixed, default
+    :return: list, values/defaults
+    """
+    # acquire resources
+    token = self._token
+    loads = self._loads
+    size = self.CHUNK_SIZE
+    keys = tuple(map(self._convert, keys))
+    if not keys:
+      return []
+    # fetch all chunks in one round-trip
+    pipe = self._redis.pipeline(transaction = False)
+    for start in range(0, len(keys), size):
+      pipe.hmget(token, keys[start:start + size])
+    return [
+      default if value is None else loads(value)
+      for chunk in pipe.execute() for value in chunk
+    ]
+
   def items(self):
     """
     Acquire all items from data store
     :return: tuple<tuple>, the k-v pairs
     """
-    yield from map(
-      lambda _: (_[0], self._loads(_[1])),
-      self._redis.hgetall(self._token).items()
+    loads = self._loads
+    yield from (
+      (key, loads(value)) for key, value
+      in self._redis.hgetall(self._token).items()
     )
 
   def keys(self):
@@ -208,9 +294,13 @@ class Dict(BaseStructure):
     :param key: mixed, the key
     :return: mixed, stored value
     """
-    # acquire item delete key
-    result = self.__getitem__(key)
-    self.__delitem__(key)
+    # acquire item delete key atomically
+    result = self._script(self.SCRIPT_POP)(
+      keys = (self._token, ), args = (self._convert(key), )
+    )
+    # deserialize result
+    if result is not None:
+      result = self._loads(result)
     return result
 
   def popitem(self):
@@ -218,7 +308,7 @@ class Dict(BaseStructure):
     Pop a pair of key & value
     :return: tuple, k-v pair
     """
-    key = next(self.keys())
+    key = next(iter(self))
     value = self.pop(key)
     return key, value
 
@@ -247,26 +337,34 @@ class Dict(BaseStructure):
     :param kwargs: keyword arguments
     :return: None
     """
+    # acquire resources
+    convert = self._convert
+    dumps = self._dumps
+    mapping = {}
     # check if item is present
     if item is not None:
       # check if item has keys attribute
       if hasattr(item, 'keys'):
         for key in item.keys():
-          self.__setitem__(key, item[key])
+          mapping[convert(key)] = dumps(item[key])
       else:
         # assumes item to be pairs
         for key, value in item:
-          self.__setitem__(key, value)
+          mapping[convert(key)] = dumps(value)
     # always update self with kwargs
     for key, value in kwargs.items():
-      self.__setitem__(key, value)
+      mapping[convert(key)] = dumps(value)
+    # store all fields in one round-trip
+    if mapping:
+      self._redis.hset(self._token, mapping = mapping)
 
   def values(self):
     """
     Acquire all values in dictionary
     :return: generator, the values
     """
-    yield from map(
-      lambda _: self._loads(_),
-      self._redis.hvals(self._token)
+    loads = self._loads
+    yield from (
+      loads(value) for value
+      in self._redis.hvals(self._token)
     )
@@ -7,54 +7,102 @@ __all__ = ('HyperLogLog', )
 
 
 class HyperLogLog(BaseStructure):
+  """
+  HyperLogLog interface for redis strings
 
-  __slots__ = ()
+  !! AUGMENTED ADDITIONS ARE BUFFERED !!
+  !! CALL COMMIT BEFORE DISCARDING !!
+  """
 
-  def __init__(self, redis, token = None):
+  __slots__ = ('_buffer', )
+
+  BUFFER_SIZE = 512
+
+  def __init__(self, redis, token = None, serialize = None):
     """
     HyperLogLog interface constructor
     :param redis: redis, the instance
     :param token: mixed, access token
+    :param serialize: mixed, the serializer
     """
     # import redis ResponseError
     from redis import ResponseError
-    super(HyperLogLog, self).__init__(redis, token)
+    super(HyperLogLog, self).__init__(redis, token, serialize)
     # set the default data type
     self._type = b'string'
-    self._initiate()
-    # check if HLL string is valid
-    try:
-      self._redis.pfcount(self._token)
-    except ResponseError:
-      self._redis.delete(self._token)
+    # serialized values pending PFADD
+    self._buffer = []
+    # random tokens cannot pre-exist
+    if token is not None:
+      self._initiate()
+      # check if HLL string is valid
+      try:
+        self._redis.pfcount(self._token)
+      except ResponseError:
+        self._redis.delete(self._token)
 
   def __iadd__(self, value):
     """
     Augmented addition operation
+
+    Values are buffered and registered
+    in batches, see `commit` method
+
     :param value: mixed, the value
     :return: self, the instance
     """
-    self.register(self._dumps(value))
+    buffer = self._buffer
+    buffer.append(self._dumps(value))
+    # register buffered values if full
+    if len(buffer) >= self.BUFFER_SIZE:
+      self.commit()
     return self
 
+  def _register(self, values):
+    """
+    Register serialized values into log
+    :param values: list, serialized values
+    :return: None
+    """
+    if values:
+      self._redis.pfadd(self._token, *values)
+
+  def commit(self):
+    """
+    Register all buffered values
+    :return: None
+    """
+    buffer = self._buffer
+    if buffer:
+      self._register(buffer)
+      buffer.clear()
+
   def register(self, *args):
     """
     Register a new value into log
     :param args: mixed, the value(s)
     :return: None
     """
-    self._redis.pfadd(
-      self._token, *map(lambda _: self._dumps(_), args)
-    )
+    self._register(tuple(map(self._dumps, args)))
 
   # aliases for register
   __add__ = __radd__ = register
 
+  def register_raw(self, *args):
+    """
+    Register serialized value(s) into log
+    :param args: bytes, serialized value(s)
+    :return: None
+    """
+    self._register(args)
+
   def cardinal(self):
     """
     Acquire count from log
     :return: int, the count
     """
+    # register pending values first
+    self.commit()
     return self._redis.pfcount(self._token)
 
   # aliases for cardinal
@@ -62,3 +110,14 @@ class HyperLogLog(BaseStructure):
 
   # log property for add and count
   log = property(cardinal, register)
+
+  def delete(self):
+    """
+    Discard buffer and delete token
+    :return: bool, successful or not
+    """
+    self._buffer.clear()
+    return super(HyperLogLog, self).delete()
+
+  # aliases for delete
+  clear = flush = delete
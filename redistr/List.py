@@ -11,17 +11,94 @@ class List(BaseStructure):
 
   __slots__ = ()
 
-  def __init__(self, redis, token = None):
+  # items per LRANGE iteration
+  CHUNK_SIZE = 1000
+
+  # remove every step-th item in one pass
+  SCRIPT_DELETE_STEP = """
+    local content = redis.call('LRANGE', KEYS[1], 0, -1)
+    local dropped = {}
+    for i = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3]) do
+      dropped[i + 1] = true
+    end
+    local kept = {}
+    for i = 1, #content do
+      if not dropped[i] then kept[#kept + 1] = content[i] end
+    end
+    redis.call('DEL', KEYS[1])
+    for i = 1, #kept, 4096 do
+      redis.call('RPUSH', KEYS[1], unpack(kept, i, math.min(i + 4095, #kept)))
+    end
+    return #content - #kept
+  """
+
+  # reverse the list in place
+  SCRIPT_REVERSE = """
+    local content = redis.call('LRANGE', KEYS[1], 0, -1)
+    redis.call('DEL', KEYS[1])
+    for i = 1, #content, 4096 do
+      redis.call('LPUSH', KEYS[1], unpack(content, i, math.min(i + 4095, #content)))
+    end
+    return #content
+  """
+
+  # repeat the list content in place
+  SCRIPT_REPEAT = """
+    local content = redis.call('LRANGE', KEYS[1], 0, -1)
+    for _ = 2, tonumber(ARGV[1]) do
+      for i = 1, #content, 4096 do
+        redis.call('RPUSH', KEYS[1], unpack(content, i, math.min(i + 4095, #content)))
+      end
+    end
+    return #content * tonumber(ARGV[1])
+  """
+
+  # find the first index of a value
+  SCRIPT_INDEX = """
+    local length = redis.call('LLEN', KEYS[1])
+    local start = tonumber(ARGV[2]) or 0
+    local stop = tonumber(ARGV[3]) or length
+    if start < 0 then start = math.max(start + length, 0) end
+    if stop < 0 then stop = math.max(stop + length, 0) end
+    stop = math.min(stop, length)
+    while start < stop do
+      local chunk = redis.call(
+        'LRANGE', KEYS[1], start, math.min(start + 1024, stop) - 1
+      )
+      for i = 1, #chunk do
+        if chunk[i] == ARGV[1] then return start + i - 1 end
+      end
+      start = start + 1024
+    end
+    return -1
+  """
+
+  # count occurrences of a value
+  SCRIPT_COUNT = """
+    local length = redis.call('LLEN', KEYS[1])
+    local count = 0
+    for start = 0, length - 1, 1024 do
+      local chunk = redis.call('LRANGE', KEYS[1], start, start + 1023)
+      for i = 1, #chunk do
+        if chunk[i] == ARGV[1] then count = count + 1 end
+      end
+    end
+    return count
+  """
+
+  def __init__(self, redis, token = None, serialize = None):
     """
     List structure interface constructor
     :param redis: redis, the redis instance
     :param token: mixed, the access token
+    :param serialize: mixed, the serializer
     """
     # invoke parent constructor
-    super(List, self).__init__(redis, token)
+    super(List, self).__init__(redis, token, serialize)
     # set the default data type
     self._type = b'list'
-    self._initiate()
+    # random tokens cannot pre-exist
+    if token is not None: self._initiate()
 
   def __add__(self, other):
     """
@@ -42,9 +119,7 @@ class List(BaseStructure):
     :param value: mixed, value
     :return: bool, if value exists
     """
-    # serialize value
-    value = self._dumps(value)
-    return value in self._content
+    return self._index(value) >= 0
 
   def __delitem__(self, index):
     """
@@ -52,79 +127,10 @@ class List(BaseStructure):
 
     O(N) operation, not encouraged
 
-    :param index: int, index
+    :param index: int|slice, index
     :return: None
     """
-    # acquire resources
-    redis = self._redis
-    token = self._token
-    transform = self._transform
-    # acquire list lengths
-    length = self.length
-    half_length = length // 2
-    # check if index provided
-    if isinstance(index, int):
-      # trim off the first element
-      if index == 0: redis.ltrim(token, 1, -1)
-      # trim off the last element
-      elif index == -1: redis.ltrim(token, 0, -2)
-      else:
-        # transform negative index
-        index = transform(index)
-        # index is on the left side
-        if 0 < index <= half_length:
-          # acquire left side segment
-          segment = redis.lrange(token, 0, index - 1)
-          # trim to the rest of the list
-          redis.ltrim(token, index + 1, -1)
-          # prepend the left side segment
-          redis.lpush(token, *reversed(segment))
-        # index is on the right side
-        elif half_length < index < length :
-          # acquire right side segment
-          segment = redis.lrange(token, index + 1, -1)
-          # trim the rest of the list
-          redis.ltrim(token, 0, index - 1)
-          # append the right side segment
-          redis.rpush(token, *segment)
-    # check if slice provided
-    elif isinstance(index, slice):
-      # warning: slow operation
-      if index.step:
-        # acquire list of indices
-        indices = tuple(range(
-          index.start, index.stop, index.step
-        ))
-        # remove one by one
-        while indices:
-          # acquire index
-          index = indices[0]
-          # shift indices by one
-          indices = tuple(map(
-            lambda _: _ - 1, indices[1:]
-          )) if indices else []
-          # delete current item
-          self.__delitem__(index)
-      else:
-        # transform negative index
-        start = transform(index.start)
-        stop = transform(index.stop)
-        # trim off left
-        if start == 0: redis.ltrim(token, stop, -1)
-        # trim off right
-        elif stop == length: redis.ltrim(token, 0, start - 1)
-        # check if slice range is valid
-        elif 0 < start <= stop <= length:
-          # trim from the left side
-          if start + 1 <= length - stop:
-            segment = redis.lrange(token, 0, start - 1)
-            redis.ltrim(token, stop, -1)
-            redis.lpush(token, *reversed(segment))
-          # trim from the right side
-          else:
-            segment = redis.lrange(token, stop, -1)
-            redis.ltrim(token, 0, start - 1)
-            redis.rpush(token, *segment)
+    self._delete(index, self.length)
 
   def __eq__(self, other):
     """
@@ -158,21 +164,29 @@ class List(BaseStructure):
       result = redis.lindex(token, index)
     # check if slice provided
     elif isinstance(index, slice):
-      # acquire a range of items
-      result = redis.lrange(
-        token, index.start, index.stop - 1
-      )
-      # TODO: IMPLEMENT RIGHT STEPPING
-      # WARNING: INCOMPATIBLE STEPPING
       if index.step:
-        result = result[::index.step]
+        # acquire normalized indices
+        indices = range(*index.indices(self.length))
+        result = []
+        if indices:
+          # acquire the covered range once
+          low, high = sorted((indices[0], indices[-1]))
+          segment = redis.lrange(token, low, high)
+          # pick items in slice order
+          result = [segment[_ - low] for _ in indices]
+      else:
+        # map open and negative bounds onto LRANGE
+        start = 0 if index.start is None else index.start
+        stop = -1 if index.stop is None else index.stop - 1
+        # acquire a range of items
+        result = [] if index.stop == 0 \
+          else redis.lrange(token, start, stop)
     # deserialize result
     if isinstance(result, bytes):
       result = self._loads(result)
     elif isinstance(result, list):
-      result = list(map(
-        lambda _: self._loads(_), result
-      ))
+      loads = self._loads
+      result = [loads(value) for value in result]
     return result
 
   def __ge__(self, other):
@@ -198,9 +212,7 @@ class List(BaseStructure):
     :return: self, this instance
     """
     if isinstance(other, (list, tuple, range)):
-      self._redis.rpush(self._token, *map(
-        lambda _: self._dumps(_), other
-      ))
+      self.extend(other)
     return self
 
   def __imul__(self, other):
@@ -211,24 +223,37 @@ class List(BaseStructure):
     """
     # check if multiplier is valid
     if isinstance(other, int):
-      # acquire resources
-      redis = self._redis
-      token = self._token
-      # append new items or flush
-      redis.rpush(
-        token, *(self._content * (other - 1))
-      ) if other >= 1 else self.clear()
+      # append copies on the server side
+      if other > 1:
+        self._script(self.SCRIPT_REPEAT)(
+          keys = (self._token, ), args = (other, )
+        )
+      # flush if not positive
+      elif other < 1:
+        self.clear()
     return self
 
   def __iter__(self):
     """
     Parsed content iterator
+
+    Streams items with windowed LRANGE
+
     :return: generator
     """
-    yield from map(
-      lambda _: self._loads(_),
-      self._redis.lrange(self._token, 0, -1)
-    )
+    # acquire resources
+    redis = self._redis
+    token = self._token
+    loads = self._loads
+    size = self.CHUNK_SIZE
+    start = 0
+    while True:
+      # acquire the next window
+      chunk = redis.lrange(token, start, start + size - 1)
+      yield from (loads(value) for value in chunk)
+      # stop after the last window
+      if len(chunk) < size: break
+      start += size
 
   def __len__(self):
     """
@@ -327,20 +352,97 @@ class List(BaseStructure):
     Acquire deserialized list content
     :return: list, the content
     """
-    return list(map(
-      lambda _: self._loads(_), self._content
-    ))
+    loads = self._loads
+    return [loads(value) for value in self._content]
 
-  def _transform(self, index):
+  def _delete(self, index, length):
+    """
+    Delete value at index with known length
+    :param index: int|slice, index
+    :param length: int, the list length
+    :return: None
+    """
+    # acquire resources
+    redis = self._redis
+    token = self._token
+    transform = self._transform
+    # acquire half list length
+    half_length = length // 2
+    # check if index provided
+    if isinstance(index, int):
+      # trim off the first element
+      if index == 0: redis.ltrim(token, 1, -1)
+      # trim off the last element
+      elif index == -1: redis.ltrim(token, 0, -2)
+      else:
+        # transform negative index
+        index = transform(index, length)
+        # index is on the left side
+        if 0 < index <= half_length:
+          # acquire left side segment
+          segment = redis.lrange(token, 0, index - 1)
+          # trim and prepend in one transaction
+          pipe = redis.pipeline(transaction = True)
+          pipe.ltrim(token, index + 1, -1)
+          pipe.lpush(token, *reversed(segment))
+          pipe.execute()
+        # index is on the right side
+        elif half_length < index < length :
+          # acquire right side segment
+          segment = redis.lrange(token, index + 1, -1)
+          # trim and append in one transaction
+          pipe = redis.pipeline(transaction = True)
+          pipe.ltrim(token, 0, index - 1)
+          if segment: pipe.rpush(token, *segment)
+          pipe.execute()
+    # check if slice provided
+    elif isinstance(index, slice):
+      # warning: slow operation
+      if index.step:
+        # acquire normalized indices
+        indices = range(*index.indices(length))
+        # remove items in a single script call
+        if indices:
+          self._script(self.SCRIPT_DELETE_STEP)(
+            keys = (token, ),
+            args = (indices[0], indices[-1], indices.step)
+          )
+      else:
+        # acquire normalized indices
+        start, stop, _ = index.indices(length)
+        stop = max(start, stop)
+        # trim off left
+        if start == 0: redis.ltrim(token, stop, -1)
+        # trim off right
+        elif stop == length: redis.ltrim(token, 0, start - 1)
+        # check if slice range is valid
+        elif 0 < start <= stop <= length:
+          # trim from the left side
+          if start + 1 <= length - stop:
+            segment = redis.lrange(token, 0, start - 1)
+            pipe = redis.pipeline(transaction = True)
+            pipe.ltrim(token, stop, -1)
+            pipe.lpush(token, *reversed(segment))
+            pipe.execute()
+          # trim from the right side
+          else:
+            segment = redis.lrange(token, stop, -1)
+            pipe = redis.pipeline(transaction = True)
+            pipe.ltrim(token, 0, start - 1)
+            if segment: pipe.rpush(token, *segment)
+            pipe.execute()
+
+  def _transform(self, index, length = None):
     """
     Transform negative index
     :param index: int, index
+    :param length: int|None, known length
     :return: int, index
     """
     # check if index is integer
     if isinstance(index, int):
-      # acquire length
-      length = self.length
+      # acquire length if unknown
+      if length is None: length = self.length
       # return positive if valid
       return length + index \
         if -length < index < 0 else index
@@ -348,6 +450,38 @@ class List(BaseStructure):
       # do nothing
       return index
 
+  def _index(self, value, start = None, stop = None):
+    """
+    Search value's index on the server
+    :param value: mixed, the value
+    :param start: int|None, the start index
+    :param stop: int|None, the stop index
+    :return: int, the index or -1
+    """
+    return self._script(self.SCRIPT_INDEX)(
+      keys = (self._token, ),
+      args = (
+        self._dumps(value),
+        b'' if start is None else start,
+        b'' if stop is None else stop
+      )
+    )
+
+  def _reset(self, content):
+    """
+    Replace list with raw content
+    :param content: iterable, raw content
+    :return: None
+    """
+    # acquire resources
+    token = self._token
+    content = tuple(content)
+    # clear and refill in one transaction
+    pipe = self._redis.pipeline(transaction = True)
+    pipe.delete(token)
+    if content: pipe.rpush(token, *content)
+    pipe.execute()
+
   def append(self, value):
     """
     Append value to the end
@@ -360,17 +494,23 @@ class List(BaseStructure):
 
   push = append
 
-  def circulate(self, token = None):
+  def circulate(self, token = None, src = 'RIGHT', dest = 'LEFT'):
     """
-    Circulate an item (RPOPLPUSH)
+    Circulate an item (RPOPLPUSH/LMOVE)
     :param token: None|mixed, the target
+    :param src: str, LEFT|RIGHT, side to pop
+    :param dest: str, LEFT|RIGHT, side to push
     :return: mixed, the item
     """
+    # acquire resources
+    redis = self._redis
     # convert token to bytes
     token = self._convert(token) \
       if token is not None else self._token
     # acquire and circulate an item
-    result = self._redis.rpoplpush(self._token, token)
+    result = redis.rpoplpush(self._token, token) \
+      if (src, dest) == ('RIGHT', 'LEFT') \
+      else redis.lmove(self._token, token, src, dest)
     # deserialize result
     if result is not None: result = self._loads(result)
     return result
@@ -380,18 +520,17 @@ class List(BaseStructure):
     Acquire a new instance
     :return: instance, the instance
     """
-    instance = List(self._redis, self._token)
-    instance.serialize = self.serialize
-    return instance
+    # bind the serializer once at construction
+    return List(self._redis, self._token, self._serialize)
 
   def count(self, value):
     """
     Count the value in list
     :return: int, the count
     """
-    # serialize value
-    value = self._dumps(value)
-    return self._content.count(value)
+    return self._script(self.SCRIPT_COUNT)(
+      keys = (self._token, ), args = (self._dumps(value), )
+    )
 
   def extend(self, iterable):
     """
@@ -399,9 +538,10 @@ class List(BaseStructure):
     :param iterable: iterable
     :return: None
     """
-    self._redis.rpush(self._token, *map(
-      lambda _: self._dumps(_), iterable
-    ))
+    # serialize values
+    values = tuple(map(self._dumps, iterable))
+    if values:
+      self._redis.rpush(self._token, *values)
 
   def index(self, value, start = None, stop = None):
     """
@@ -411,9 +551,11 @@ class List(BaseStructure):
     :param stop: the stop index
     :return: int, the index
     """
-    # serialize value
-    value = self._dumps(value)
-    return self._content.index(value, start, stop)
+    result = self._index(value, start, stop)
+    # raise like list if not found
+    if result < 0:
+      raise ValueError('Value is not in list.')
+    return result
 
   def insert(self, index, value):
     """
@@ -422,9 +564,38 @@ class List(BaseStructure):
     :param value: mixed, the value
     :return: None
     """
+    # acquire resources
+    redis = self._redis
+    token = self._token
     # serialize value
     value = self._dumps(value)
-    self._redis.lset(self._token, index, value)
+    # acquire length and clamp index
+    length = self.length
+    index = max(self._transform(index, length), 0)
+    # insert to the left end
+    if index == 0:
+      redis.lpush(token, value)
+    # insert to the right end
+    elif index >= length:
+      redis.rpush(token, value)
+    # index is on the left side
+    elif index <= length // 2:
+      # acquire left side segment
+      segment = redis.lrange(token, 0, index - 1)
+      # trim and prepend in one transaction
+      pipe = redis.pipeline(transaction = True)
+      pipe.ltrim(token, index, -1)
+      pipe.lpush(token, value, *reversed(segment))
+      pipe.execute()
+    # index is on the right side
+    else:
+      # acquire right side segment
+      segment = redis.lrange(token, index, -1)
+      # trim and append in one transaction
+      pipe = redis.pipeline(transaction = True)
+      pipe.ltrim(token, 0, index - 1)
+      pipe.rpush(token, value, *segment)
+      pipe.execute()
 
   def pop(self, index = None, flag = True):
     """
@@ -433,6 +604,8 @@ class List(BaseStructure):
     :param flag: bool, from right or not
     :return: mixed|None, the item
     """
+    # import urandom
+    from os import urandom
     # acquire resources
     redis = self._redis
     token = self._token
@@ -448,7 +621,7 @@ class List(BaseStructure):
     # check if index is integer
     elif isinstance(index, int):
       # transform negative index
-      index = self._transform(index)
+      index = self._transform(index, length)
       # regular left pop operation
       if index == 0:
         result = redis.lpop(token)
@@ -456,21 +629,26 @@ class List(BaseStructure):
       elif index == length - 1:
         result = redis.rpop(token)
       elif 0 < index < length - 1:
-        # acquire and remove item
-        result = self.__getitem__(index)
-        self.__delitem__(index)
+        # mark item with a unique placeholder
+        placeholder = urandom(self.TOKEN_LENGTH)
+        # acquire and remove item in one transaction
+        pipe = redis.pipeline(transaction = True)
+        pipe.lindex(token, index)
+        pipe.lset(token, index, placeholder)
+        pipe.lrem(token, 1, placeholder)
+        result = pipe.execute()[0]
     # check if slice provided
     elif isinstance(index, slice):
-      # acquire and remove item
+      # acquire parsed and remove items
       result = self.__getitem__(index)
-      self.__delitem__(index)
+      self._delete(index, length)
+      return result
     # deserialize result
     if isinstance(result, bytes):
       result = self._loads(result)
     elif isinstance(result, list):
-      result = list(map(
-        lambda _: self._loads(_), result
-      ))
+      loads = self._loads
+      result = [loads(value) for value in result]
     return result
 
   def popleft(self):
@@ -515,13 +693,8 @@ class List(BaseStructure):
     Reverse the list from redis
     :return: None
     """
-    # acquire raw content
-    content = self._content
-    # clear and reset list
-    self.clear()
-    self._redis.rpush(
-      self._token, *reversed(content)
-    )
+    # reverse on the server side
+    self._script(self.SCRIPT_REVERSE)(keys = (self._token, ))
 
   def sort(self, *args, **kwargs):
     """
@@ -534,7 +707,4 @@ class List(BaseStructure):
     content = self.content
     content.sort(*args, **kwargs)
     # clear and reset list
-    self.clear()
-    self._redis.rpush(self._token, *map(
-      lambda _: self._dumps(_), content
-    ))
+    self._reset(map(self._dumps, content))
@@ -0,0 +1,60 @@
+# Author: Hansheng Zhao <copyrighthero@gmail.com> (https://www.zhs.me)
+
+
+__all__ = ('make_client', 'default_client')
+
+
+# lazily built default client
+_default = None
+
+
+def make_client(
+  host = 'localhost', port = 6379,
+  max_connections = 64, **kwargs
+):
+  """
+  Build a redis client backed by a pool
+
+  Share the client between structures to
+  reuse connections, use one client per
+  thread pool sized to the worker count
+
+  :param host: str, the redis host
+  :param port: int, the redis port
+  :param max_connections: int, pool size
+  :param kwargs: other connection arguments
+  :return: Redis, the pooled client
+  """
+  from redis import Redis, ConnectionPool
+  return Redis(connection_pool = ConnectionPool(
+    host = host, port = port,
+    max_connections = max_connections, **kwargs
+  ))
+
+
+def default_client():
+  """
+  Acquire the shared default client
+
+  Configured with REDIS_URL or REDIS_HOST
+  and REDIS_PORT environment variables
+
+  :return: Redis, the pooled client
+  """
+  global _default
+  if _default is None:
+    from os import environ
+    # prefer url configuration if present
+    if 'REDIS_URL' in environ:
+      from redis import Redis, ConnectionPool
+      _default = Redis(
+        connection_pool = ConnectionPool.from_url(
+          environ['REDIS_URL'], max_connections = 64
+        )
+      )
+    else:
+      _default = make_client(
+        environ.get('REDIS_HOST', 'localhost'),
+        int(environ.get('REDIS_PORT', 6379))
+      )
+  return _default
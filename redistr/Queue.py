@@ -9,15 +9,23 @@ __all__ = ('Queue', )
 class Queue(List):
   """ Blocking queue based on redis list """
 
-  __slots__ = ()
+  __slots__ = ('_tokens', '_own_tokens')
 
-  def __init__(self, redis, token = None):
+  # maximum resolved token entries
+  TOKENS_CACHE = 128
+
+  def __init__(self, redis, token = None, serialize = None):
     """
     Queue interface constructor
     :param redis: redis, the instance
     :param token: str|bytes, the token
+    :param serialize: mixed, the serializer
     """
-    super(Queue, self).__init__(redis, token)
+    super(Queue, self).__init__(redis, token, serialize)
+    # resolved tokens keyed by identity
+    self._tokens = {}
+    # own token alone, the most common case
+    self._own_tokens = (self._token, )
 
   @staticmethod
   def _timeout(timeout):
@@ -62,16 +70,8 @@ class Queue(List):
     """
     # acquire resources
     redis = self._redis
-    convert = self._convert
     # sanitize token parameter
-    token = tuple(map(lambda _: convert(_), token)) \
-      if isinstance(
-        token, (list, tuple, range, set, frozenset)
-      ) else (
-        None if token is None else (convert(token), )
-      )
-    token = (self._token, ) \
-      if token is None else (self._token, *token)
+    token = self._resolve_tokens(token)
     # lint timeout parameter
     timeout = self._timeout(timeout) if block else 0
     # check flag
@@ -94,6 +94,48 @@ class Queue(List):
           break
     return result
 
+  def _resolve_tokens(self, token = None):
+    """
+    Resolve own and extra queue tokens
+
+    Results for immutable tokens are cached,
+    polling the same queues skips conversion
+
+    :param token: mixed, the queue token(s)
+    :return: tuple<bytes>, the tokens
+    """
+    # no extra tokens to resolve
+    if token is None:
+      return self._own_tokens
+    # only immutable tokens are safe to cache
+    if not isinstance(token, (bytes, str, tuple, frozenset)):
+      return self._build_tokens(token)
+    tokens = self._tokens
+    # the kept reference prevents identity reuse
+    entry = tokens.get(id(token))
+    if entry is None or entry[0] is not token:
+      if len(tokens) >= self.TOKENS_CACHE: tokens.clear()
+      entry = tokens[id(token)] = (token, self._build_tokens(token))
+    return entry[1]
+
+  def _build_tokens(self, token = None):
+    """
+    Convert own and extra queue tokens
+    :param token: mixed, the queue token(s)
+    :return: tuple<bytes>, the tokens
+    """
+    # acquire resources
+    convert = self._convert
+    # sanitize token parameter
+    token = tuple(map(convert, token)) \
+      if isinstance(
+        token, (list, tuple, range, set, frozenset)
+      ) else (
+        None if token is None else (convert(token), )
+      )
+    return (self._token, ) \
+      if token is None else (self._token, *token)
+
   def _get(
     self, block = True, timeout = 0, flag = True
   ):
@@ -147,6 +189,81 @@ class Queue(List):
   # aliases for get
   recv = get
 
+  def get_many(
+    self, count = 10, block = True,
+    timeout = 0, flag = True, token = None
+  ):
+    """
+    Blocking get many items from the queue(s)
+
+    Uses LMPOP/BLMPOP where available, falls
+    back to a pipelined pop after a wake-up
+
+    :param count: int, maximum item count
+    :param block: bool, whether to block
+    :param timeout: int, block length
+    :param flag: bool, whether get right
+    :param token: mixed, extra queue token(s)
+    :return: list, the items
+    """
+    # nothing to get for non-positive counts
+    if count <= 0:
+      return []
+    # acquire resources
+    redis = self._redis
+    loads = self._loads
+    tokens = self._resolve_tokens(token)
+    direction = 'RIGHT' if flag else 'LEFT'
+    # lint timeout parameter
+    timeout = self._timeout(timeout) if block else 0
+    # pop many items in one command
+    result = self._command(
+      'BLMPOP',
+      lambda: redis.execute_command(
+        'BLMPOP', timeout, len(tokens), *tokens,
+        direction, 'COUNT', count
+      ),
+      lambda: self._get_many(tokens, count, timeout, flag)
+    ) if block else self._command(
+      'LMPOP',
+      lambda: redis.execute_command(
+        'LMPOP', len(tokens), *tokens,
+        direction, 'COUNT', count
+      ),
+      lambda: self._get_many(tokens, count, None, flag)
+    )
+    return [] if result is None else \
+      [loads(_) for _ in result[1]]
+
+  def _get_many(self, tokens, count, timeout = None, flag = True):
+    """
+    Get many items with pipelined pops
+    :param tokens: tuple<bytes>, the queue tokens
+    :param count: int, maximum item count
+    :param timeout: int|None, block length or no block
+    :param flag: bool, whether get right
+    :return: tuple|None, token & raw items like LMPOP
+    """
+    # acquire resources
+    redis = self._redis
+    result = []
+    # wait for the first item then pop the rest
+    if timeout is not None:
+      item = redis.brpop(tokens, timeout) \
+        if flag else redis.blpop(tokens, timeout)
+      if item is None: return None
+      tokens = (item[0], )
+      result.append(item[1])
+    # pop remaining items in one round-trip,
+    # from the first non-empty queue like LMPOP
+    for item in tokens:
+      pipe = redis.pipeline(transaction = False)
+      for _ in range(count - len(result)):
+        pipe.rpop(item) if flag else pipe.lpop(item)
+      result.extend(_ for _ in pipe.execute() if _ is not None)
+      if result: break
+    return (None, result) if result else None
+
   def get_left(self, block = True, timeout = 0):
     """
     Blocking get an item from the head
@@ -182,13 +299,16 @@ class Queue(List):
   set_right = send_right = put_right
 
   def circulate(
-    self, token = None, block = True, timeout = 0
+    self, token = None, block = True, timeout = 0,
+    src = 'RIGHT', dest = 'LEFT'
   ):
     """
-    Blocking circulate an item (BRPOPLPUSH)
+    Blocking circulate an item (BRPOPLPUSH/BLMOVE)
     :param token: None|mixed, the target
     :param block: bool, whether block or not
     :param timeout: int, timeout length
+    :param src: str, LEFT|RIGHT, side to pop
+    :param dest: str, LEFT|RIGHT, side to push
     :return: mixed, the item
     """
     # acquire resources
@@ -199,12 +319,41 @@ class Queue(List):
     # lint timeout parameter
     timeout = self._timeout(timeout) if block else 0
     # acquire and circulate an item
-    result = redis.brpoplpush(
-      self._token, token, timeout
-    ) if block else redis.rpoplpush(self._token, token)
+    if (src, dest) == ('RIGHT', 'LEFT'):
+      result = redis.brpoplpush(
+        self._token, token, timeout
+      ) if block else redis.rpoplpush(self._token, token)
+    else:
+      result = redis.blmove(
+        self._token, token, timeout, src, dest
+      ) if block else redis.lmove(self._token, token, src, dest)
     # deserialize result
     if result is not None: result = self._loads(result)
     return result
 
+  def wake(self, timeout = 0):
+    """
+    Block until the queue has an item
+
+    Moves the tail item onto itself, so
+    workers may drain with non-blocking gets;
+    before redis 6.2 the item is rotated
+
+    :param timeout: int, timeout length
+    :return: bool, whether woken by an item
+    """
+    # acquire resources
+    redis = self._redis
+    token = self._token
+    # lint timeout parameter
+    timeout = self._timeout(timeout)
+    # block on a self-loop move
+    result = self._command(
+      'BLMOVE',
+      lambda: redis.blmove(token, token, timeout, 'RIGHT', 'RIGHT'),
+      lambda: redis.brpoplpush(token, token, timeout)
+    )
+    return result is not None
+
   # alias for get & pur message
   msg = property(get, put)
@@ -0,0 +1,289 @@
+# Author: Hansheng Zhao <copyrighthero@gmail.com> (https://www.zhs.me)
+
+
+__all__ = ('Serialize', )
+
+
+class Serialize(object):
+  """
+  Serializer with optional compression
+
+  Defaults to msgpack (msgspec if available,
+  pickle if neither) without compression;
+  compressed payloads are prefixed with a
+  one byte flag, binary payloads are then
+  stored without serializing
+
+  Garbage collection is paused while loading
+  large payloads in compressed mode and in
+  loads_many, plain loads stays the decoder
+  """
+
+  __slots__ = (
+    '_serialize', '_compress', '_threshold',
+    'dumps', 'loads'
+  )
+
+  # payload flags when compression enabled
+  FLAG_RAW = 0
+  FLAG_COMPRESSED = 1
+  FLAG_BINARY = 2
+
+  # minimum payload size for compression
+  THRESHOLD = 1024
+  # minimum payload size to pause gc on loads
+  GC_THRESHOLD = 16384
+
+  # shared default instance
+  _instance = None
+
+  def __init__(
+    self, serialize = None, compress = None,
+    threshold = THRESHOLD, level = None
+  ):
+    """
+    Serializer constructor
+    :param serialize: str|None, json|msgpack|pickle
+    :param compress: str|None, zlib|bz2|lzma|none|None
+    :param threshold: int, minimum size to compress
+    :param level: int|None, compression level
+    """
+    # preserve configurations
+    self._serialize = self._preferred() \
+      if serialize is None else serialize.lower()
+    self._compress = None \
+      if compress is None or compress.lower() == 'none' \
+      else compress.lower()
+    self._threshold = threshold
+    # resolve serializer and compressor
+    encode, decode = self._serializer(self._serialize)
+    compress, decompress = self._compression(
+      self._compress, level
+    )
+    # bind functions directly if not compressing
+    if compress is None:
+      self.dumps, self.loads = encode, decode
+    else:
+      self.dumps = self._compose_dumps(
+        encode, compress, threshold
+      )
+      self.loads = self._compose_loads(decode, decompress)
+
+  @classmethod
+  def default(cls):
+    """
+    Acquire the shared default serializer
+    :return: Serialize, the instance
+    """
+    if cls._instance is None:
+      cls._instance = cls()
+    return cls._instance
+
+  @staticmethod
+  def _preferred():
+    """
+    Acquire the preferred serializer
+    :return: str, msgpack if available
+    """
+    try:
+      import msgspec
+      return 'msgpack'
+    except ImportError:
+      pass
+    try:
+      import msgpack
+      return 'msgpack'
+    except ImportError:
+      return 'pickle'
+
+  @staticmethod
+  def _serializer(serialize):
+    """
+    Resolve serialize functions
+    :param serialize: str, the serializer
+    :return: tuple, encode & decode functions
+    """
+    if serialize == 'msgpack':
+      try:
+        # prefer msgspec for speed
+        from msgspec.msgpack import Encoder, Decoder
+        return Encoder().encode, Decoder().decode
+      except ImportError:
+        # pin string handling across versions
+        from functools import partial
+        from threading import local
+        from msgpack import Packer, unpackb
+        # packers are not thread-safe
+        packers = local()
+
+        def packb(payload):
+          """
+          Serialize payload with a reused packer
+          :param payload: mixed, serializable object
+          :return: bytes, the serialized payload
+          """
+          try:
+            packer = packers.packer
+          except AttributeError:
+            packer = packers.packer = Packer(use_bin_type = True)
+          return packer.pack(payload)
+
+        # allow non-string map keys like msgspec
+        unpack = partial(unpackb, raw = False)
+        try:
+          unpack(b'\x80', strict_map_key = False)
+          unpack = partial(unpack, strict_map_key = False)
+        except TypeError:
+          # versions before 1.0 are not strict
+          pass
+        return packb, unpack
+    elif serialize == 'pickle':
+      from pickle import dumps, loads
+      return dumps, loads
+    elif serialize == 'json':
+      from json import dumps, loads
+      return (
+        lambda _: dumps(_).encode(encoding = 'UTF8'),
+        loads
+      )
+    else:
+      raise ValueError('Unsupported serializer.')
+
+  @staticmethod
+  def _compression(compress, level = None):
+    """
+    Resolve compress functions
+    :param compress: str|None, the compressor
+    :param level: int|None, compression level
+    :return: tuple, compress & decompress functions
+    """
+    from functools import partial
+    if compress is None:
+      return None, None
+    elif compress == 'zlib':
+      from zlib import compress, decompress
+      keyword = 'level'
+    elif compress == 'bz2':
+      from bz2 import compress, decompress
+      keyword = 'compresslevel'
+    elif compress == 'lzma':
+      from lzma import compress, decompress
+      keyword = 'preset'
+    else:
+      raise ValueError('Unsupported compressor.')
+    # pin the level if one is requested
+    if level is not None:
+      compress = partial(compress, **{keyword: level})
+    return compress, decompress
+
+  @classmethod
+  def _compose_dumps(cls, encode, compress, threshold):
+    """
+    Compose serialize and compress functions
+    :param encode: callable, the serialize function
+    :param compress: callable, the compress function
+    :param threshold: int, minimum size to compress
+    :return: callable, the dumps function
+    """
+    # payload flags
+    raw = bytes((cls.FLAG_RAW, ))
+    compressed = bytes((cls.FLAG_COMPRESSED, ))
+    binary = bytes((cls.FLAG_BINARY, ))
+
+    def dumps(payload):
+      """
+      Serialize and compress payload
+      :param payload: mixed, serializable object
+      :return: bytes, the serialized payload
+      """
+      # pass opaque binary through untouched
+      if isinstance(payload, (bytes, bytearray, memoryview)):
+        return binary + payload
+      payload = encode(payload)
+      # compress large payloads only
+      return raw + payload \
+        if len(payload) < threshold \
+        else compressed + compress(payload)
+
+    return dumps
+
+  @classmethod
+  def _compose_loads(cls, decode, decompress):
+    """
+    Compose decompress and un-serialize functions
+    :param decode: callable, the un-serialize function
+    :param decompress: callable, the decompress function
+    :return: callable, the loads function
+    """
+    # import gc switches
+    from gc import disable, enable, isenabled
+    # payload flags
+    compressed = cls.FLAG_COMPRESSED
+    binary = cls.FLAG_BINARY
+    threshold = cls.GC_THRESHOLD
+
+    def loads(payload):
+      """
+      Decompress and un-serialize payload
+      :param payload: bytes, the serialized payload
+      :return: mixed, the object
+      """
+      flag = payload[0]
+      # binary payloads are stored as is
+      if flag == binary:
+        return bytes(payload[1:])
+      # pause gc while loading large payloads
+      paused = len(payload) > threshold and isenabled()
+      if paused: disable()
+      try:
+        # decompress flagged payloads without copying
+        return decode(decompress(memoryview(payload)[1:])) \
+          if flag == compressed else decode(payload[1:])
+      finally:
+        if paused: enable()
+
+    return loads
+
+  @property
+  def serializer(self):
+    """
+    Serializer name getter
+    :return: str, the serializer
+    """
+    return self._serialize
+
+  @property
+  def compressor(self):
+    """
+    Compressor name getter
+    :return: str|None, the compressor
+    """
+    return self._compress
+
+  def dumps_many(self, items):
+    """
+    Serialize items as a single payload
+
+    Compressing once over all the items
+    amortizes the compressor start-up
+
+    :param items: iterable, serializable objects
+    :return: bytes, the serialized payload
+    """
+    return self.dumps(list(items))
+
+  def loads_many(self, payload):
+    """
+    Un-serialize a multi-item payload
+    :param payload: bytes, the serialized payload
+    :return: list, the objects
+    """
+    # import gc switches
+    from gc import disable, enable, isenabled
+    # pause gc while loading large payloads
+    paused = len(payload) > self.GC_THRESHOLD and isenabled()
+    if paused: disable()
+    try:
+      return list(self.loads(payload))
+    finally:
+      if paused: enable()
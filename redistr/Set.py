@@ -10,16 +10,23 @@ class Set(BaseStructure):
 
   __slots__ = ()
 
-  def __init__(self, redis, token = None):
+  # members per SSCAN iteration
+  SCAN_COUNT = 1000
+  # minimum local sequence size to upload
+  TEMP_THRESHOLD = 16
+
+  def __init__(self, redis, token = None, serialize = None):
     """
     Set interface constructor
     :param redis: redis, the instance
     :param token: mixed, access token
+    :param serialize: mixed, the serializer
     """
-    super(Set, self).__init__(redis, token)
+    super(Set, self).__init__(redis, token, serialize)
     # set the default data type
     self._type = b'set'
-    self._initiate()
+    # random tokens cannot pre-exist
+    if token is not None: self._initiate()
 
   def __contains__(self, item):
     """
@@ -38,10 +45,19 @@ class Set(BaseStructure):
     :return: bool, whether equals
     """
     if isinstance(other, Set):
-      return self._content == other._content \
-        if self.length == other.length else False
-    else:
-      return self.content == other
+      # compare cardinality before members
+      if self.length != other.length:
+        return False
+      # equal sized sets leave no difference
+      return not self._redis.sdiff(self._token, other._token)
+    elif not isinstance(other, (set, frozenset)):
+      return False
+    try:
+      values = self._values(other)
+    except Exception:
+      # unserializable members cannot be stored
+      return False
+    return self._content == values
 
   def __gt__(self, other):
     """
@@ -54,12 +70,22 @@ class Set(BaseStructure):
   def __iter__(self):
     """
     Content iterator
-    :return: generator
+
+    Streams members with SSCAN, repeated
+    members are skipped; members changed
+    while iterating may or may not appear
+
+    :return: iterator
     """
-    yield from map(
-      lambda _: self._loads(_),
-      self._redis.smembers(self._token)
+    # acquire resources
+    loads = self._loads
+    cursor, members = self._redis.sscan(
+      self._token, 0, count = self.SCAN_COUNT
     )
+    # small sets complete in a single scan
+    if cursor == 0:
+      return iter([loads(_) for _ in set(members)])
+    return self._scan(cursor, members)
 
   def __len__(self):
     """
@@ -106,8 +132,7 @@ class Set(BaseStructure):
     :return: set, the parsed content
     """
     return set(map(
-      lambda _: self._loads(_),
-      self._redis.smembers(self._token)
+      self._loads, self._redis.smembers(self._token)
     ))
 
   @property
@@ -123,14 +148,104 @@ class Set(BaseStructure):
     """
     Filter out tokens and other instances
     :param iterable: tuple, the arguments
-    :return: tuple<map, map>, the results
+    :return: tuple<list, list>, the results
     """
     # filter out tokens and other instances
-    return (map(lambda _: _.token, filter(
-      lambda _: isinstance(_, Set), iterable
-    )), filter(
-      lambda _: not isinstance(_, Set), iterable
-    ))
+    return (
+      [_._token for _ in iterable if isinstance(_, Set)],
+      [_ for _ in iterable if not isinstance(_, Set)]
+    )
+
+  def _values(self, iterable):
+    """
+    Serialize members of a local sequence
+    :param iterable: iterable, the members
+    :return: set<bytes>, serialized members
+    """
+    return set(map(self._dumps, iterable))
+
+  def _combine(self, command, args):
+    """
+    Combine sequences, members match by
+    serialized value whatever the sizes
+
+    Large local sequences are uploaded into
+    temporary keys, small ones stay local
+
+    :param command: str, sdiff|sinter|sunion
+    :param args: tuple, other sequences
+    :return: set, the result
+    """
+    # import redis response error
+    from redis.exceptions import ResponseError
+    tokens, others = self._filter(args)
+    values = [self._values(_) for _ in others]
+    threshold = self.TEMP_THRESHOLD
+    small = [_ for _ in values if len(_) < threshold]
+    large = [_ for _ in values if len(_) >= threshold]
+    try:
+      result = self._remote(command, tokens, large)
+    except ResponseError:
+      # read-only servers cannot hold temporary keys
+      if not large: raise
+      result = getattr(self._redis, command)(self._token, *tokens)
+      small.extend(large)
+    # combine small sequences locally
+    result = set(result)
+    {
+      'sdiff': result.difference_update,
+      'sinter': result.intersection_update,
+      'sunion': result.update
+    }[command](*small)
+    return set(map(self._loads, result))
+
+  def _remote(self, command, tokens, values = ()):
+    """
+    Combine sequences on redis server
+    :param command: str, sdiff|sinter|sunion
+    :param tokens: list<bytes>, other set tokens
+    :param values: list<set>, serialized sequences
+    :return: set<bytes>, the raw result
+    """
+    # import urandom
+    from os import urandom
+    # acquire resources
+    redis = self._redis
+    token = self._token
+    # read-only without local sequences
+    if not values:
+      return getattr(redis, command)(token, *tokens)
+    # upload, combine and clean up in one transaction
+    temps = []
+    pipe = redis.pipeline(transaction = True)
+    for value in values:
+      temp = token + b':tmp:' + urandom(self.TOKEN_LENGTH)
+      pipe.sadd(temp, *value)
+      temps.append(temp)
+    getattr(pipe, command)(token, *tokens, *temps)
+    pipe.delete(*temps)
+    return pipe.execute()[-2]
+
+  def _scan(self, cursor, members):
+    """
+    Continue scanning set members
+    :param cursor: int, the next cursor
+    :param members: list, scanned members
+    :return: generator, the parsed members
+    """
+    # acquire resources
+    redis = self._redis
+    token = self._token
+    loads = self._loads
+    count = self.SCAN_COUNT
+    # raw members already yielded
+    seen = set()
+    while True:
+      members = set(members).difference(seen)
+      seen.update(members)
+      yield from [loads(_) for _ in members]
+      if cursor == 0: break
+      cursor, members = redis.sscan(token, cursor, count = count)
 
   def add(self, *args):
     """
@@ -140,17 +255,48 @@ class Set(BaseStructure):
     """
     return self._redis.sadd(
       self._token,
-      *map(lambda _: self._dumps(_), args)
+      *map(self._dumps, args)
     )
 
+  def contains_many(self, items):
+    """
+    Check if items exist in set
+    :param items: iterable, the items
+    :return: list<bool>, whether exist
+    """
+    # acquire resources
+    redis = self._redis
+    token = self._token
+    values = tuple(map(self._dumps, items))
+    if not values:
+      return []
+    # check all items in one round-trip
+    return list(map(bool, self._command(
+      'SMISMEMBER',
+      lambda: redis.smismember(token, values),
+      lambda: self._contains_many(values)
+    )))
+
+  def _contains_many(self, values):
+    """
+    Check serialized members with a pipeline
+    :param values: tuple<bytes>, the members
+    :return: list<int>, whether exist
+    """
+    # acquire resources
+    token = self._token
+    pipe = self._redis.pipeline(transaction = False)
+    for value in values:
+      pipe.sismember(token, value)
+    return pipe.execute()
+
   def copy(self):
     """
     Create a new instance
     :return: instance
     """
-    instance = Set(self._redis, self._token)
-    instance.serialize = self._serialize
-    return instance
+    # bind the serializer once at construction
+    return Set(self._redis, self._token, self._serialize)
 
   def difference(self, *args):
     """
@@ -158,12 +304,7 @@ class Set(BaseStructure):
     :param args: other sequences
     :return: set, the difference
     """
-    tokens, others = self._filter(args)
-    # return the differences
-    return set(map(
-      lambda _: self._loads(_),
-      self._redis.sdiff(self._token, *tokens)
-    )).difference(*others)
+    return self._combine('sdiff', args)
 
   # aliases for differences
   __sub__ = __rsub__ = difference
@@ -174,15 +315,21 @@ class Set(BaseStructure):
     :param args: other sequences
     :return: None
     """
+    # acquire resources
+    token = self._token
+    dumps = self._dumps
     tokens, others = self._filter(args)
+    # members of local sequences to remove
+    values = {dumps(_) for other in others for _ in other}
+    if not tokens and not values:
+      return
+    # update in one transaction
+    pipe = self._redis.pipeline(transaction = True)
     # update differences using tokens
-    self._redis.sdiffstore(
-      self._token, self._token, *tokens
-    )
+    if tokens: pipe.sdiffstore(token, token, *tokens)
     # discard any common items from set
-    self.discard(
-      *self.content.intersection(*others)
-    )
+    if values: pipe.srem(token, *values)
+    pipe.execute()
 
   # aliases for difference update
   __isub__ = difference_update
@@ -195,7 +342,7 @@ class Set(BaseStructure):
     """
     return self._redis.srem(
       self._token,
-      *map(lambda _: self._dumps(_), args)
+      *map(self._dumps, args)
     )
 
   # aliases for discard
@@ -207,14 +354,7 @@ class Set(BaseStructure):
     :param args: other sequences
     :return: set, the intersection
     """
-    tokens, others = self._filter(args)
-    # redis intersect using tokens
-    intersect = set(map(
-      lambda _: self._loads(_),
-      self._redis.sinter(self._token, *tokens)
-    ))
-    # return the intersection of all items
-    return intersect.intersection(*others)
+    return self._combine('sinter', args)
 
   # aliases for intersection
   __and__ = __rand__ = intersection
@@ -225,15 +365,25 @@ class Set(BaseStructure):
     :param args: other sequences
     :return: None
     """
+    # import urandom
+    from os import urandom
+    # acquire resources
+    token = self._token
     tokens, others = self._filter(args)
-    # update intersections using tokens
-    self._redis.sinterstore(
-      self._token, self._token, *tokens
-    )
-    # discard any stray items from set
-    self.discard(
-      *self.content.difference(*others)
-    )
+    if not tokens and not others:
+      return
+    # upload, intersect and clean up in one transaction
+    temps = []
+    pipe = self._redis.pipeline(transaction = True)
+    for other in others:
+      temp = token + b':tmp:' + urandom(self.TOKEN_LENGTH)
+      values = self._values(other)
+      # missing keys act as empty sets
+      if values: pipe.sadd(temp, *values)
+      temps.append(temp)
+    pipe.sinterstore(token, token, *tokens, *temps)
+    if temps: pipe.delete(*temps)
+    pipe.execute()
 
   # aliases for intersection update
   __iand__ = intersection_update
@@ -249,7 +399,7 @@ class Set(BaseStructure):
         self._token, other._token
       )) == 0
     else:
-      return self.content.isdisjoint(other)
+      return not any(self.contains_many(other))
 
   def issubset(self, other):
     """
@@ -258,11 +408,16 @@ class Set(BaseStructure):
     :return: bool, whether is subset
     """
     if isinstance(other, Set):
-      return self._redis.sunion(
-        self._token, other._token
-      ) == other._content
-    else:
-      return self.content.issubset(other)
+      # no members left out of other
+      return not self._redis.sdiff(self._token, other._token)
+    values = self._values(other)
+    # larger sets cannot be contained
+    if self.length > len(values):
+      return False
+    # stream raw members, stop on first stray
+    return all(_ in values for _ in self._redis.sscan_iter(
+      self._token, count = self.SCAN_COUNT
+    ))
 
   # aliases for issubset
   __le__ = issubset
@@ -274,14 +429,13 @@ class Set(BaseStructure):
     :return: bool, whether is superset
     """
     if isinstance(other, Set):
-      return self._redis.sunion(
-        self._token, other._token
-      ) == self._content
+      # no members of other left out
+      return not self._redis.sdiff(other._token, self._token)
     else:
-      return self.content.issuperset(other)
+      return all(self.contains_many(other))
 
   # aliases for issuperset
-  __ge__ = issubset
+  __ge__ = issuperset
 
   def pop(self):
     """
@@ -294,9 +448,25 @@ class Set(BaseStructure):
     """
     Get symmetric diff of sequences
     :param other: mixed, sequence
-    :return: set, the intersection
+    :return: set, the symmetric difference
     """
-    return self.union(other) - self.intersection(other)
+    if isinstance(other, Set):
+      # acquire both differences in one round-trip
+      pipe = self._redis.pipeline(transaction = True)
+      pipe.sdiff(self._token, other._token)
+      pipe.sdiff(other._token, self._token)
+      return set(map(self._loads, set().union(*pipe.execute())))
+    # compare serialized members, decode once
+    dumps = self._dumps
+    loads = self._loads
+    others = {dumps(_): _ for _ in other}
+    content = self._content
+    return {
+      loads(_) for _ in content if _ not in others
+    }.union(
+      value for key, value in others.items()
+      if key not in content
+    )
 
   # aliases for symmetric difference
   __xor__ = __rxor__ = symmetric_difference
@@ -309,7 +479,7 @@ class Set(BaseStructure):
     """
     intersect = self.intersection(other)
     self.union_update(other)
-    self.discard(*intersect)
+    if intersect: self.discard(*intersect)
 
   # aliases for symmetric difference update
   __ixor__ = symmetric_difference_update
@@ -320,14 +490,7 @@ class Set(BaseStructure):
     :param args: other sequences
     :return: set, the intersection
     """
-    tokens, others = self._filter(args)
-    # redis union using tokens
-    union = set(map(
-      lambda _: self._loads(_),
-      self._redis.sunion(self._token, *tokens)
-    ))
-    # return the intersection of all items
-    return union.union(*others)
+    return self._combine('sunion', args)
 
   # aliases for union
   __or__ = __ror__ = union
@@ -355,4 +518,9 @@ class Set(BaseStructure):
     :param args: other iterable
     :return: None
     """
-    for item in args: self.add(*item)
+    # serialize members of all iterables
+    dumps = self._dumps
+    values = [dumps(_) for item in args for _ in item]
+    # add all members in one round-trip
+    if values:
+      self._redis.sadd(self._token, *values)
@@ -0,0 +1,173 @@
+# Author: Hansheng Zhao <copyrighthero@gmail.com> (https://www.zhs.me)
+
+from .BaseStructure import BaseStructure
+
+
+__all__ = ('TypedList', )
+
+
+class TypedList(BaseStructure):
+  """
+  Fixed-width numeric list on redis strings
+
+  Items are packed with a single-value struct
+  format, ie: '<q' for int64, '<d' for double
+  """
+
+  __slots__ = ('_struct', '_size')
+
+  def __init__(self, redis, token = None, fmt = '<q'):
+    """
+    TypedList interface constructor
+    :param redis: redis, the redis instance
+    :param token: mixed, the access token
+    :param fmt: str, the struct item format
+    """
+    # import struct packer
+    from struct import Struct
+    super(TypedList, self).__init__(redis, token)
+    # preserve packer and item size
+    self._struct = Struct(fmt)
+    self._size = self._struct.size
+    # set the default data type
+    self._type = b'string'
+    # random tokens cannot pre-exist
+    if token is not None: self._initiate()
+
+  def __getitem__(self, index):
+    """
+    Get value from packed content
+    :param index: int|slice, the index
+    :return: mixed|list, the value(s)
+    """
+    # acquire resources
+    redis = self._redis
+    token = self._token
+    size = self._size
+    # check if index provided
+    if isinstance(index, int):
+      # transform negative index
+      if index < 0: index += self.length
+      if index < 0:
+        raise IndexError('Index out of range.')
+      # acquire the packed item
+      result = redis.getrange(
+        token, index * size, (index + 1) * size - 1
+      )
+      if len(result) != size:
+        raise IndexError('Index out of range.')
+      return self._struct.unpack(result)[0]
+    # check if slice provided
+    elif isinstance(index, slice):
+      # acquire normalized range
+      start, stop, step = index.indices(self.length)
+      # slice whole content if stepping backwards
+      if step < 0:
+        return self.content[index]
+      # acquire the packed range
+      result = self._unpack(redis.getrange(
+        token, start * size, stop * size - 1
+      )) if start < stop else []
+      return result[::step]
+    # other types not supported
+    else:
+      raise TypeError('Index must be an integer or slice.')
+
+  def __iter__(self):
+    """
+    Parsed content iterator
+    :return: generator
+    """
+    yield from self.content
+
+  def __len__(self):
+    """
+    Acquire list length
+    :return: int, the length
+    """
+    return self._redis.strlen(self._token) // self._size
+
+  def __setitem__(self, index, value):
+    """
+    Set value to index in packed content
+    :param index: int, index
+    :param value: mixed, value
+    :return: None
+    """
+    # only single items can be set
+    if not isinstance(index, int):
+      raise TypeError('Index must be an integer.')
+    # transform negative index
+    length = self.length
+    if index < 0: index += length
+    if not 0 <= index < length:
+      raise IndexError('Index out of range.')
+    self._redis.setrange(
+      self._token, index * self._size,
+      self._struct.pack(value)
+    )
+
+  @property
+  def _content(self):
+    """
+    Acquire raw packed content
+    :return: bytes, the content
+    """
+    return self._redis.get(self._token) or b''
+
+  @property
+  def raw(self):
+    """
+    Acquire raw packed content
+    :return: bytes, the content
+    """
+    return self._content
+
+  @property
+  def length(self):
+    """
+    Length property getter
+    :return: int, the length
+    """
+    return self.__len__()
+
+  @property
+  def content(self):
+    """
+    Acquire unpacked list content
+    :return: list, the content
+    """
+    return self._unpack(self._content)
+
+  def _unpack(self, payload):
+    """
+    Unpack packed items
+    :param payload: bytes, packed items
+    :return: list, the values
+    """
+    return [
+      _[0] for _ in self._struct.iter_unpack(payload)
+    ]
+
+  def append(self, value):
+    """
+    Append value to the end
+    :param value: mixed, value
+    :return: None
+    """
+    self._redis.append(
+      self._token, self._struct.pack(value)
+    )
+
+  # aliases for append
+  push = append
+
+  def extend(self, iterable):
+    """
+    Extend list with iterable
+    :param iterable: iterable
+    :return: None
+    """
+    payload = b''.join(map(self._struct.pack, iterable))
+    if payload:
+      self._redis.append(self._token, payload)
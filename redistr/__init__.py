@@ -5,10 +5,14 @@ from .List import List
 from .Dict import Dict
 from .Queue import Queue
 from .HyperLogLog import HyperLogLog
+from .TypedList import TypedList
+from .Serialize import Serialize
+from .Pool import make_client, default_client
 
 
 __all__ = (
-  'Set', 'List', 'Dict', 'Queue', 'HyperLogLog',
+  'Set', 'List', 'Dict', 'Queue', 'HyperLogLog', 'TypedList',
+  'Serialize', 'make_client', 'default_client',
   '__author__', '__version__', '__license__'
 )
 